@@ -17,6 +17,9 @@ from aiohttp import web, web_request
 from aiohttp.web_response import Response
 import aiohttp_cors
 
+# Resolved once at import; served on every request to /
+WEB_EXPLORER_PATH = Path(__file__).parent / "web_explorer.html"
+
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -27,6 +30,145 @@ from data_loader import DataLoader
 logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:%(message)s")
 logger = logging.getLogger(__name__)
 
+# Tool metadata served by /tools; static, so it is built once at import time
+TOOL_DEFINITIONS = [
+    {
+        "name": "search_attack",
+        "description": "Search across all MITRE ATT&CK entities (tactics, techniques, groups, mitigations)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"query": {"type": "string", "description": "Search query"}},
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "list_tactics",
+        "description": "List all MITRE ATT&CK tactics",
+        "inputSchema": {"type": "object", "properties": {}, "required": []},
+    },
+    {
+        "name": "get_technique",
+        "description": "Get detailed information about a specific technique",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "technique_id": {
+                    "type": "string",
+                    "description": "MITRE technique ID (e.g., T1055)",
+                }
+            },
+            "required": ["technique_id"],
+        },
+    },
+    {
+        "name": "get_group_techniques",
+        "description": "Get techniques used by a specific threat group",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "group_id": {
+                    "type": "string",
+                    "description": "MITRE group ID (e.g., G0016)",
+                }
+            },
+            "required": ["group_id"],
+        },
+    },
+    {
+        "name": "get_technique_mitigations",
+        "description": "Get mitigations for a specific technique",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "technique_id": {
+                    "type": "string",
+                    "description": "MITRE technique ID (e.g., T1055)",
+                }
+            },
+            "required": ["technique_id"],
+        },
+    },
+    {
+        "name": "build_attack_path",
+        "description": "Construct multi-stage attack paths through the MITRE ATT&CK kill chain",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "start_tactic": {
+                    "type": "string",
+                    "description": "Starting tactic ID (e.g., TA0001)",
+                },
+                "end_tactic": {
+                    "type": "string",
+                    "description": "Target tactic ID (e.g., TA0040)",
+                },
+                "group_id": {
+                    "type": "string",
+                    "description": "Optional: Filter by specific threat group",
+                },
+                "platform": {
+                    "type": "string",
+                    "description": "Optional: Filter by platform (Windows, Linux, macOS)",
+                },
+            },
+            "required": ["start_tactic", "end_tactic"],
+        },
+    },
+    {
+        "name": "analyze_coverage_gaps",
+        "description": "Analyze defensive coverage gaps against threat groups",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "threat_groups": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of threat group IDs",
+                },
+                "technique_list": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional: Array of specific techniques to analyze",
+                },
+                "exclude_mitigations": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional: Array of implemented mitigation IDs to exclude",
+                },
+            },
+            "required": ["threat_groups"],
+        },
+    },
+    {
+        "name": "detect_technique_relationships",
+        "description": "Discover complex STIX relationships and attribution chains",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "technique_id": {
+                    "type": "string",
+                    "description": "Primary technique to analyze",
+                },
+                "relationship_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional: Array of relationship types to include",
+                },
+                "depth": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 3,
+                    "description": "Optional: Relationship traversal depth (default: 2, max: 3)",
+                },
+            },
+            "required": ["technique_id"],
+        },
+    },
+]
+
+# Serialized once so /tools requests skip re-encoding the unchanging payload
+TOOLS_RESPONSE_BODY = json.dumps({"tools": TOOL_DEFINITIONS})
+
 
 class HTTPProxy:
     """HTTP proxy server that bridges web requests to MCP tools."""
@@ -65,9 +207,8 @@ class HTTPProxy:
     async def serve_web_interface(self, request: web_request.Request) -> Response:
         """Serve the web explorer HTML interface."""
         try:
-            web_explorer_path = Path(__file__).parent / "web_explorer.html"
-            if web_explorer_path.exists():
-                with open(web_explorer_path, "r", encoding="utf-8") as f:
+            if WEB_EXPLORER_PATH.exists():
+                with open(WEB_EXPLORER_PATH, "r", encoding="utf-8") as f:
                     html_content = f.read()
                 return web.Response(text=html_content, content_type="text/html")
             else:
@@ -84,144 +225,9 @@ class HTTPProxy:
     async def handle_tools_list(self, request: web_request.Request) -> Response:
         """Handle requests for the list of available tools."""
         try:
-            tools = [
-                {
-                    "name": "search_attack",
-                    "description": "Search across all MITRE ATT&CK entities (tactics, techniques, groups, mitigations)",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query"}
-                        },
-                        "required": ["query"],
-                    },
-                },
-                {
-                    "name": "list_tactics",
-                    "description": "List all MITRE ATT&CK tactics",
-                    "inputSchema": {"type": "object", "properties": {}, "required": []},
-                },
-                {
-                    "name": "get_technique",
-                    "description": "Get detailed information about a specific technique",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "technique_id": {
-                                "type": "string",
-                                "description": "MITRE technique ID (e.g., T1055)",
-                            }
-                        },
-                        "required": ["technique_id"],
-                    },
-                },
-                {
-                    "name": "get_group_techniques",
-                    "description": "Get techniques used by a specific threat group",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "group_id": {
-                                "type": "string",
-                                "description": "MITRE group ID (e.g., G0016)",
-                            }
-                        },
-                        "required": ["group_id"],
-                    },
-                },
-                {
-                    "name": "get_technique_mitigations",
-                    "description": "Get mitigations for a specific technique",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "technique_id": {
-                                "type": "string",
-                                "description": "MITRE technique ID (e.g., T1055)",
-                            }
-                        },
-                        "required": ["technique_id"],
-                    },
-                },
-                {
-                    "name": "build_attack_path",
-                    "description": "Construct multi-stage attack paths through the MITRE ATT&CK kill chain",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "start_tactic": {
-                                "type": "string",
-                                "description": "Starting tactic ID (e.g., TA0001)",
-                            },
-                            "end_tactic": {
-                                "type": "string",
-                                "description": "Target tactic ID (e.g., TA0040)",
-                            },
-                            "group_id": {
-                                "type": "string",
-                                "description": "Optional: Filter by specific threat group",
-                            },
-                            "platform": {
-                                "type": "string",
-                                "description": "Optional: Filter by platform (Windows, Linux, macOS)",
-                            },
-                        },
-                        "required": ["start_tactic", "end_tactic"],
-                    },
-                },
-                {
-                    "name": "analyze_coverage_gaps",
-                    "description": "Analyze defensive coverage gaps against threat groups",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "threat_groups": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Array of threat group IDs",
-                            },
-                            "technique_list": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Optional: Array of specific techniques to analyze",
-                            },
-                            "exclude_mitigations": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Optional: Array of implemented mitigation IDs to exclude",
-                            },
-                        },
-                        "required": ["threat_groups"],
-                    },
-                },
-                {
-                    "name": "detect_technique_relationships",
-                    "description": "Discover complex STIX relationships and attribution chains",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "technique_id": {
-                                "type": "string",
-                                "description": "Primary technique to analyze",
-                            },
-                            "relationship_types": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Optional: Array of relationship types to include",
-                            },
-                            "depth": {
-                                "type": "integer",
-                                "minimum": 1,
-                                "maximum": 3,
-                                "description": "Optional: Relationship traversal depth (default: 2, max: 3)",
-                            },
-                        },
-                        "required": ["technique_id"],
-                    },
-                },
-            ]
-
-            return web.json_response({"tools": tools})
+            return web.Response(
+                text=TOOLS_RESPONSE_BODY, content_type="application/json"
+            )
 
         except Exception as e:
             logger.error(f"Error handling tools list: {e}")
@@ -1588,7 +1588,13 @@ def create_mcp_server(data_loader=None):
             result_text += "RELATIONSHIP SUMMARY\n"
             result_text += "===================\n"
             result_text += f"Total Relationships Found: {total_relationships}\n"
-            result_text += f"Relationship Types Analyzed: {len([rt for rt in relationship_types if discovered_relationships[rt]['incoming'] or discovered_relationships[rt]['outgoing']])}\n"
+            types_with_results = sum(
+                1
+                for rt in relationship_types
+                if discovered_relationships[rt]["incoming"]
+                or discovered_relationships[rt]["outgoing"]
+            )
+            result_text += f"Relationship Types Analyzed: {types_with_results}\n"
             result_text += f"Analysis Completed at Depth: {depth}\n\n"
 
             if total_relationships == 0:
@@ -706,10 +706,11 @@ class STIXParser:
 
     def _extract_tactic_data(self, stix_obj: Dict[str, Any]) -> ParsedEntityData:
         """
-        Extract tactic-specific data from STIX object using STIX2 library.
+        Extract tactic-specific data from STIX object.
 
-        This method now uses the official STIX2 library for parsing instead of
-        raw dictionary access, providing better validation and standards compliance.
+        Tactics carry no fields beyond id, name and description, so the dictionary
+        is handed straight to the STIX2 object extractor without a stix2.parse()
+        round-trip whose validated result would be discarded.
 
         Args:
             stix_obj: STIX object dictionary
@@ -717,32 +718,15 @@ class STIXParser:
         Returns:
             dict: Tactic-specific data
         """
-        try:
-            # Convert dictionary to STIX2 library object
-            # For tactics (x-mitre-tactic), we use the generic parse function
-            stix2_obj = stix2.parse(stix_obj, allow_custom=True)
-
-            # Use the STIX2 library-based extraction method
-            return self._extract_tactic_data_from_stix_object(stix2_obj)
-
-        except (STIXError, InvalidValueError, MissingPropertiesError) as e:
-            logger.warning(
-                f"STIX2 library parsing failed for tactic: {e}"
-            )
-            return {}
-        except Exception as e:
-            logger.warning(
-                f"Unexpected error parsing tactic with STIX2 library: {e}"
-            )
-            return {}
-
+        return self._extract_tactic_data_from_stix_object(stix_obj)
 
     def _extract_mitigation_data(self, stix_obj: Dict[str, Any]) -> ParsedEntityData:
         """
-        Extract mitigation-specific data from STIX object using STIX2 library.
+        Extract mitigation-specific data from STIX object.
 
-        This method now uses the official STIX2 library for parsing instead of
-        raw dictionary access, providing better validation and standards compliance.
+        Mitigation data is only the techniques list filled in later by relationship
+        analysis, so the dictionary is handed straight to the STIX2 object extractor
+        without a stix2.parse() round-trip.
 
         Args:
             stix_obj: STIX object dictionary
@@ -750,24 +734,7 @@ class STIXParser:
         Returns:
             dict: Mitigation-specific data
         """
-        try:
-            # Convert dictionary to STIX2 library CourseOfAction object
-            stix2_obj = stix2.parse(stix_obj, allow_custom=True)
-
-            # Use the STIX2 library-based extraction method
-            return self._extract_mitigation_data_from_stix_object(stix2_obj)
-
-        except (STIXError, InvalidValueError, MissingPropertiesError) as e:
-            logger.warning(
-                f"STIX2 library parsing failed for mitigation: {e}"
-            )
-            return {"techniques": []}
-        except Exception as e:
-            logger.warning(
-                f"Unexpected error parsing mitigation with STIX2 library: {e}"
-            )
-            return {"techniques": []}
-
+        return self._extract_mitigation_data_from_stix_object(stix_obj)
 
     def _extract_mitre_id_from_stix_object_with_validation(
         self, stix_obj: STIXObjectOrDict
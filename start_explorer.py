@@ -18,8 +18,6 @@ from pathlib import Path
 # Add current directory to path
 sys.path.append(os.path.dirname(__file__))
 
-from http_proxy import create_http_proxy_server
-
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +44,9 @@ async def start_web_explorer():
         )
         print("⏳ This may take 10-15 seconds for initial data loading...")
 
+        # Imported here so main() can report missing aiohttp before it is loaded
+        from http_proxy import create_http_proxy_server
+
         # Create and start the HTTP proxy server
         runner, mcp_server = await create_http_proxy_server(host, port)
 
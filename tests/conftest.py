@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration for the test suite.
+
+Tests marked ``integration`` need a live MCP HTTP server, so they are
+skipped unless ``--run-integration`` is given.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="need --run-integration option to run")
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(skip_integration)
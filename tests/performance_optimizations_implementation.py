@@ -7,7 +7,7 @@ the performance analysis phase.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any
 from functools import lru_cache
 import weakref
 
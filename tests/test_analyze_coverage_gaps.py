@@ -7,7 +7,6 @@ coverage gap analysis, mitigation filtering, and prioritization recommendations.
 
 import pytest
 from unittest.mock import Mock
-from mcp.types import TextContent
 from src.mcp_server import create_mcp_server
 from src.data_loader import DataLoader
 
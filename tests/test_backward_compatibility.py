@@ -10,10 +10,9 @@ import pytest
 import json
 import uuid
 from unittest.mock import Mock, patch
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any
 
 import stix2
-from stix2 import Bundle, AttackPattern, IntrusionSet, CourseOfAction
 from stix2.exceptions import STIXError, InvalidValueError, MissingPropertiesError
 
 from src.parsers.stix_parser import STIXParser
@@ -21,109 +20,115 @@ from src.data_loader import DataLoader
 from src.mcp_server import create_mcp_server
 
 
-class TestBackwardCompatibility:
-    """Test backward compatibility of STIX2 library refactor."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = STIXParser()
-        self.sample_stix_data = self._create_comprehensive_test_data()
-
-    def _create_comprehensive_test_data(self) -> Dict[str, Any]:
-        """Create comprehensive STIX test data covering all entity types."""
-        # Create technique with full data
-        technique = stix2.AttackPattern(
-            name="Process Injection",
-            description="Adversaries may inject code into processes in order to evade process-based defenses.",
-            external_references=[
-                stix2.ExternalReference(
-                    source_name="mitre-attack",
-                    external_id="T1055",
-                    url="https://attack.mitre.org/techniques/T1055/",
-                )
-            ],
-            x_mitre_platforms=["Windows", "macOS", "Linux"],
-            kill_chain_phases=[
-                stix2.KillChainPhase(
-                    kill_chain_name="mitre-attack", phase_name="defense-evasion"
-                ),
-                stix2.KillChainPhase(
-                    kill_chain_name="mitre-attack", phase_name="privilege-escalation"
-                ),
+def _create_comprehensive_test_data() -> Dict[str, Any]:
+    """Create comprehensive STIX test data covering all entity types."""
+    # Create technique with full data
+    technique = stix2.AttackPattern(
+        name="Process Injection",
+        description="Adversaries may inject code into processes in order to evade process-based defenses.",
+        external_references=[
+            stix2.ExternalReference(
+                source_name="mitre-attack",
+                external_id="T1055",
+                url="https://attack.mitre.org/techniques/T1055/",
+            )
+        ],
+        x_mitre_platforms=["Windows", "macOS", "Linux"],
+        kill_chain_phases=[
+            stix2.KillChainPhase(
+                kill_chain_name="mitre-attack", phase_name="defense-evasion"
+            ),
+            stix2.KillChainPhase(
+                kill_chain_name="mitre-attack", phase_name="privilege-escalation"
+            ),
+        ],
+        allow_custom=True,
+    )
+
+    # Create group with aliases
+    group = stix2.IntrusionSet(
+        name="APT29",
+        description="APT29 is a threat group that has been attributed to Russia's Foreign Intelligence Service.",
+        aliases=["APT29", "Cozy Bear", "The Dukes", "YTTRIUM"],
+        external_references=[
+            stix2.ExternalReference(
+                source_name="mitre-attack",
+                external_id="G0016",
+                url="https://attack.mitre.org/groups/G0016/",
+            )
+        ],
+    )
+
+    # Create tactic
+    tactic = stix2.parse(
+        {
+            "type": "x-mitre-tactic",
+            "spec_version": "2.1",
+            "id": f"x-mitre-tactic--{uuid.uuid4()}",
+            "name": "Defense Evasion",
+            "description": "The adversary is trying to avoid being detected.",
+            "external_references": [
+                {
+                    "source_name": "mitre-attack",
+                    "external_id": "TA0005",
+                    "url": "https://attack.mitre.org/tactics/TA0005/",
+                }
             ],
-            allow_custom=True,
-        )
+            "x_mitre_shortname": "defense-evasion",
+        },
+        allow_custom=True,
+    )
+
+    # Create mitigation
+    mitigation = stix2.CourseOfAction(
+        name="Application Isolation and Sandboxing",
+        description="Restrict execution of code to a virtual environment on or in transit to an endpoint system.",
+        external_references=[
+            stix2.ExternalReference(
+                source_name="mitre-attack",
+                external_id="M1048",
+                url="https://attack.mitre.org/mitigations/M1048/",
+            )
+        ],
+    )
 
-        # Create group with aliases
-        group = stix2.IntrusionSet(
-            name="APT29",
-            description="APT29 is a threat group that has been attributed to Russia's Foreign Intelligence Service.",
-            aliases=["APT29", "Cozy Bear", "The Dukes", "YTTRIUM"],
-            external_references=[
-                stix2.ExternalReference(
-                    source_name="mitre-attack",
-                    external_id="G0016",
-                    url="https://attack.mitre.org/groups/G0016/",
-                )
-            ],
-        )
+    # Create relationships
+    uses_relationship = stix2.Relationship(
+        relationship_type="uses", source_ref=group.id, target_ref=technique.id
+    )
 
-        # Create tactic
-        tactic = stix2.parse(
-            {
-                "type": "x-mitre-tactic",
-                "spec_version": "2.1",
-                "id": f"x-mitre-tactic--{uuid.uuid4()}",
-                "name": "Defense Evasion",
-                "description": "The adversary is trying to avoid being detected.",
-                "external_references": [
-                    {
-                        "source_name": "mitre-attack",
-                        "external_id": "TA0005",
-                        "url": "https://attack.mitre.org/tactics/TA0005/",
-                    }
-                ],
-                "x_mitre_shortname": "defense-evasion",
-            },
-            allow_custom=True,
-        )
+    mitigates_relationship = stix2.Relationship(
+        relationship_type="mitigates",
+        source_ref=mitigation.id,
+        target_ref=technique.id,
+    )
 
-        # Create mitigation
-        mitigation = stix2.CourseOfAction(
-            name="Application Isolation and Sandboxing",
-            description="Restrict execution of code to a virtual environment on or in transit to an endpoint system.",
-            external_references=[
-                stix2.ExternalReference(
-                    source_name="mitre-attack",
-                    external_id="M1048",
-                    url="https://attack.mitre.org/mitigations/M1048/",
-                )
-            ],
-        )
+    # Create bundle
+    bundle = stix2.Bundle(
+        technique,
+        group,
+        tactic,
+        mitigation,
+        uses_relationship,
+        mitigates_relationship,
+        allow_custom=True,
+    )
 
-        # Create relationships
-        uses_relationship = stix2.Relationship(
-            relationship_type="uses", source_ref=group.id, target_ref=technique.id
-        )
+    return json.loads(bundle.serialize())
 
-        mitigates_relationship = stix2.Relationship(
-            relationship_type="mitigates",
-            source_ref=mitigation.id,
-            target_ref=technique.id,
-        )
 
-        # Create bundle
-        bundle = stix2.Bundle(
-            technique,
-            group,
-            tactic,
-            mitigation,
-            uses_relationship,
-            mitigates_relationship,
-            allow_custom=True,
-        )
+@pytest.fixture(scope="class")
+def sample_stix_data() -> Dict[str, Any]:
+    """Serialized STIX bundle, built once per class since stix2 validation is costly."""
+    return _create_comprehensive_test_data()
 
-        return json.loads(bundle.serialize())
+
+class TestBackwardCompatibility:
+    """Test backward compatibility of STIX2 library refactor."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = STIXParser()
 
     def _get_expected_legacy_format(self, entity_types: List[str]) -> Dict[str, List[Dict[str, Any]]]:
         """Get expected output format that matches legacy behavior."""
@@ -162,11 +167,11 @@ class TestBackwardCompatibility:
         
         return result
 
-    def test_technique_extraction_output_format(self):
+    def test_technique_extraction_output_format(self, sample_stix_data):
         """Test that technique extraction produces expected output format."""
         # Parse with STIX2 library method
         result = self.parser._parse_with_stix2_library(
-            self.sample_stix_data, ["techniques"]
+            sample_stix_data, ["techniques"]
         )
 
         # Verify technique data structure and content
@@ -186,11 +191,11 @@ class TestBackwardCompatibility:
         assert "TA0004" in technique["tactics"]  # privilege-escalation
         assert technique["mitigations"] == []  # Initially empty
 
-    def test_group_extraction_output_identical(self):
+    def test_group_extraction_output_identical(self, sample_stix_data):
         """Test that group extraction produces identical output."""
         # Parse with new STIX2 library method
         new_result = self.parser._parse_with_stix2_library(
-            self.sample_stix_data, ["groups"]
+            sample_stix_data, ["groups"]
         )
 
         # Verify group data structure and content
@@ -208,11 +213,11 @@ class TestBackwardCompatibility:
         assert "APT29" not in group["aliases"]  # Primary name filtered out
         assert group["techniques"] == []  # Initially empty
 
-    def test_tactic_extraction_output_identical(self):
+    def test_tactic_extraction_output_identical(self, sample_stix_data):
         """Test that tactic extraction produces identical output."""
         # Parse with new STIX2 library method
         new_result = self.parser._parse_with_stix2_library(
-            self.sample_stix_data, ["tactics"]
+            sample_stix_data, ["tactics"]
         )
 
         # Verify tactic data structure and content
@@ -224,11 +229,11 @@ class TestBackwardCompatibility:
         assert tactic["name"] == "Defense Evasion"
         assert "trying to avoid being detected" in tactic["description"]
 
-    def test_mitigation_extraction_output_identical(self):
+    def test_mitigation_extraction_output_identical(self, sample_stix_data):
         """Test that mitigation extraction produces identical output."""
         # Parse with new STIX2 library method
         new_result = self.parser._parse_with_stix2_library(
-            self.sample_stix_data, ["mitigations"]
+            sample_stix_data, ["mitigations"]
         )
 
         # Verify mitigation data structure and content
@@ -241,13 +246,13 @@ class TestBackwardCompatibility:
         assert "virtual environment" in mitigation["description"]
         assert mitigation["techniques"] == []  # Initially empty
 
-    def test_all_entity_types_extraction_identical(self):
+    def test_all_entity_types_extraction_identical(self, sample_stix_data):
         """Test that all entity types can be extracted together with identical output."""
         entity_types = ["techniques", "groups", "tactics", "mitigations"]
 
         # Parse with new STIX2 library method
         new_result = self.parser._parse_with_stix2_library(
-            self.sample_stix_data, entity_types
+            sample_stix_data, entity_types
         )
 
         # Verify all entity types are present
@@ -342,14 +347,14 @@ class TestBackwardCompatibility:
         assert mitigation["name"] == "Test Mitigation"
 
     @pytest.mark.asyncio
-    async def test_all_mcp_tools_work_with_refactored_parser(self):
+    async def test_all_mcp_tools_work_with_refactored_parser(self, sample_stix_data):
         """Test that all 8 MCP tools continue to work with refactored parser."""
         # Create mock data loader with comprehensive test data
         mock_data_loader = Mock(spec=DataLoader)
 
         # Parse test data with refactored parser
         parsed_data = self.parser.parse(
-            self.sample_stix_data, ["techniques", "groups", "tactics", "mitigations"]
+            sample_stix_data, ["techniques", "groups", "tactics", "mitigations"]
         )
 
         # Add relationships for testing
@@ -506,13 +511,13 @@ class TestBackwardCompatibility:
             assert "techniques" in result
             assert len(result["techniques"]) == 0
 
-    def test_data_loader_integration_backward_compatibility(self):
+    def test_data_loader_integration_backward_compatibility(self, sample_stix_data):
         """Test that DataLoader integration maintains backward compatibility."""
         data_loader = DataLoader()
 
         # Mock the download to return our test data
         with patch.object(data_loader, "download_data") as mock_download:
-            mock_download.return_value = self.sample_stix_data
+            mock_download.return_value = sample_stix_data
 
             # Mock configuration
             with patch.object(
@@ -548,17 +553,17 @@ class TestBackwardCompatibility:
                 assert len(result["groups"]) == 1
                 assert result["groups"][0]["id"] == "G0016"
 
-    def test_relationship_processing_backward_compatibility(self):
+    def test_relationship_processing_backward_compatibility(self, sample_stix_data):
         """Test that relationship processing maintains backward compatibility."""
         data_loader = DataLoader()
 
         # Process relationships using the refactored parser
         entity_types = ["techniques", "groups", "mitigations"]
-        parsed_data = self.parser.parse(self.sample_stix_data, entity_types)
+        parsed_data = self.parser.parse(sample_stix_data, entity_types)
 
         # Process relationships
         enhanced_data = data_loader._process_relationships(
-            self.sample_stix_data, parsed_data
+            sample_stix_data, parsed_data
         )
 
         # Verify relationships are processed correctly
@@ -701,6 +706,7 @@ class TestBackwardCompatibility:
         assert "platforms" not in technique or technique["platforms"] == []
         assert "tactics" not in technique or technique["tactics"] == []
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_real_mitre_attack_data_integration(self):
         """Test integration with real MITRE ATT&CK data to ensure production compatibility."""
@@ -6,8 +6,7 @@ attack path construction, kill chain sequencing, and filtering capabilities.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
-from mcp.types import TextContent
+from unittest.mock import Mock
 from src.mcp_server import create_mcp_server
 from src.data_loader import DataLoader
 
@@ -8,7 +8,7 @@ and that integration tests are properly skipped when servers aren't available.
 
 import os
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 
 
 class TestCICDCompatibility:
@@ -6,11 +6,14 @@ correctly with the refactored STIX parser using the official STIX2 library.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from src.mcp_server import create_mcp_server
 from src.data_loader import DataLoader
 from src.parsers.stix_parser import STIXParser
 
+# Lowercase markers of an error response, matched against lowercased tool output
+ERROR_KEYWORDS = ("not found", "invalid", "error", "no")
+
 
 class TestComprehensiveMCPIntegration:
     """Test comprehensive integration of all 8 MCP tools with refactored parser."""
@@ -377,10 +380,8 @@ class TestComprehensiveMCPIntegration:
             assert len(result) > 0
             assert result[0].type == "text"
             # Should contain some form of error message
-            assert any(
-                keyword in result[0].text.lower()
-                for keyword in ["not found", "invalid", "error", "no"]
-            )
+            text_lower = result[0].text.lower()
+            assert any(keyword in text_lower for keyword in ERROR_KEYWORDS)
 
     @pytest.mark.asyncio
     async def test_data_consistency_across_all_tools_with_refactored_parser(
@@ -540,18 +541,16 @@ class TestComprehensiveMCPIntegration:
 
         # Verify technique structure
         parsed_technique = result["techniques"][0]
-        expected_technique_fields = [
+        expected_technique_fields = {
             "id",
             "name",
             "description",
             "platforms",
             "tactics",
             "mitigations",
-        ]
-        for field in expected_technique_fields:
-            assert (
-                field in parsed_technique
-            ), f"Missing field '{field}' in parsed technique"
+        }
+        missing = expected_technique_fields - parsed_technique.keys()
+        assert not missing, f"Missing fields {sorted(missing)} in parsed technique"
 
         assert parsed_technique["id"] == "T9999"
         assert parsed_technique["name"] == "Test Technique"
@@ -560,9 +559,9 @@ class TestComprehensiveMCPIntegration:
 
         # Verify group structure
         parsed_group = result["groups"][0]
-        expected_group_fields = ["id", "name", "description", "aliases", "techniques"]
-        for field in expected_group_fields:
-            assert field in parsed_group, f"Missing field '{field}' in parsed group"
+        expected_group_fields = {"id", "name", "description", "aliases", "techniques"}
+        missing = expected_group_fields - parsed_group.keys()
+        assert not missing, f"Missing fields {sorted(missing)} in parsed group"
 
         assert parsed_group["id"] == "G9999"
         assert parsed_group["name"] == "Test Group"
@@ -1,14 +1,9 @@
 import unittest
 from unittest.mock import patch, MagicMock
-import sys
-import os
 import uuid
-from datetime import datetime, timezone
-import stix2
 from stix2 import Relationship
 from stix2.exceptions import STIXError, InvalidValueError, MissingPropertiesError
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from src.data_loader import DataLoader
 from src.config_loader import load_config
 
@@ -20,9 +15,6 @@ functionality for downloading, parsing, and processing MITRE ATT&CK data.
 """
 
 
-# Add src directory to path
-
-
 class TestDataLoader(unittest.TestCase):
     """Test cases for the DataLoader class."""
 
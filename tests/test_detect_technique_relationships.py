@@ -7,7 +7,6 @@ relationship discovery, hierarchy traversal, and attribution analysis.
 
 import pytest
 from unittest.mock import Mock
-from mcp.types import TextContent
 from src.mcp_server import create_mcp_server
 from src.data_loader import DataLoader
 
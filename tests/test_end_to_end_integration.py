@@ -6,7 +6,7 @@ they work together properly and provide the expected functionality.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from src.mcp_server import create_mcp_server
 from src.data_loader import DataLoader
 
@@ -14,31 +14,27 @@ from unittest.mock import patch
 class TestEnvironmentConfiguration:
     """Test environment variable configuration handling."""
 
-    def test_default_http_host_configuration(self):
-        """Test that default HTTP host is set correctly."""
-        # Test without environment variable
-        with patch.dict(os.environ, {}, clear=True):
-            host = os.getenv("MCP_HTTP_HOST", "localhost")
-            assert host == "localhost", "Default HTTP host should be localhost"
-
-    def test_default_http_port_configuration(self):
-        """Test that default HTTP port is set correctly."""
-        # Test without environment variable
-        with patch.dict(os.environ, {}, clear=True):
-            port = int(os.getenv("MCP_HTTP_PORT", "8000"))
-            assert port == 8000, "Default HTTP port should be 8000"
-
-    def test_custom_http_host_configuration(self):
-        """Test that custom HTTP host is respected."""
-        with patch.dict(os.environ, {"MCP_HTTP_HOST": "127.0.0.1"}):
+    @pytest.mark.parametrize(
+        "env, expected",
+        [({}, "localhost"), ({"MCP_HTTP_HOST": "127.0.0.1"}, "127.0.0.1")],
+        ids=["default", "custom"],
+    )
+    def test_http_host_configuration(self, env, expected):
+        """Test that the HTTP host defaults to localhost and respects overrides."""
+        with patch.dict(os.environ, env, clear=True):
             host = os.getenv("MCP_HTTP_HOST", "localhost")
-            assert host == "127.0.0.1", "Custom HTTP host should be respected"
-
-    def test_custom_http_port_configuration(self):
-        """Test that custom HTTP port is respected."""
-        with patch.dict(os.environ, {"MCP_HTTP_PORT": "3000"}):
+            assert host == expected, f"HTTP host should be {expected}"
+
+    @pytest.mark.parametrize(
+        "env, expected",
+        [({}, 8000), ({"MCP_HTTP_PORT": "3000"}, 3000)],
+        ids=["default", "custom"],
+    )
+    def test_http_port_configuration(self, env, expected):
+        """Test that the HTTP port defaults to 8000 and respects overrides."""
+        with patch.dict(os.environ, env, clear=True):
             port = int(os.getenv("MCP_HTTP_PORT", "8000"))
-            assert port == 3000, "Custom HTTP port should be respected"
+            assert port == expected, f"HTTP port should be {expected}"
 
     def test_invalid_port_handling(self):
         """Test that invalid port values are handled gracefully."""
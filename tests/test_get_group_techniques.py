@@ -6,8 +6,6 @@ including group validation, technique retrieval, and edge cases.
 """
 
 import pytest
-from unittest.mock import Mock
-from src.data_loader import DataLoader
 
 
 def _find_group_by_id(group_id: str, data: dict) -> dict:
@@ -6,11 +6,6 @@ including technique retrieval, error handling, and data validation.
 """
 
 import pytest
-import asyncio
-from unittest.mock import Mock, patch
-from mcp.types import TextContent
-from src.mcp_server import create_mcp_server
-from src.data_loader import DataLoader
 
 
 def _get_technique_by_id(technique_id: str, data: dict) -> dict:
@@ -230,14 +225,12 @@ class TestGetTechnique:
         assert technique["id"] == "T1055"
         assert technique["name"] == "Process Injection"
 
-    def test_get_technique_by_id_not_found(self):
-        """Test handling of invalid technique ID."""
-        technique = _get_technique_by_id("T9999", self.sample_data)
-        assert technique is None
-
-    def test_get_technique_by_id_empty_id(self):
-        """Test handling of empty technique ID."""
-        technique = _get_technique_by_id("", self.sample_data)
+    @pytest.mark.parametrize(
+        "technique_id", ["T9999", ""], ids=["not_found", "empty_id"]
+    )
+    def test_get_technique_by_id_returns_none(self, technique_id):
+        """Test handling of unknown and empty technique IDs."""
+        technique = _get_technique_by_id(technique_id, self.sample_data)
         assert technique is None
 
     def test_format_technique_response_full_details(self):
@@ -276,43 +269,44 @@ class TestGetTechnique:
         assert "TA0006: Credential Access" in response
         assert "Mitigations: None available" in response
 
-    def test_format_technique_response_missing_tactic_names(self):
-        """Test formatting when tactic names are not found in data."""
-        # Create data with missing tactic
-        data_missing_tactic = self.sample_data.copy()
-        data_missing_tactic["tactics"] = [
-            {
-                "id": "TA0004",
-                "name": "Privilege Escalation",
-                "description": "The adversary is trying to gain higher-level permissions.",
-            }
-            # TA0005 is missing
-        ]
-
-        technique = self.sample_data["techniques"][0]  # T1055
-        response = _format_technique_response(technique, data_missing_tactic)
-
-        assert "TA0004: Privilege Escalation" in response
-        assert "TA0005: (Name not found)" in response
-
-    def test_format_technique_response_missing_mitigation_names(self):
-        """Test formatting when mitigation names are not found in data."""
-        # Create data with missing mitigation
-        data_missing_mitigation = self.sample_data.copy()
-        data_missing_mitigation["mitigations"] = [
-            {
-                "id": "M1040",
-                "name": "Behavior Prevention on Endpoint",
-                "description": "Use capabilities to prevent suspicious behavior patterns.",
-            }
-            # M1026 is missing
-        ]
+    @pytest.mark.parametrize(
+        "section, kept_entry, present, missing",
+        [
+            (
+                "tactics",
+                {
+                    "id": "TA0004",
+                    "name": "Privilege Escalation",
+                    "description": "The adversary is trying to gain higher-level permissions.",
+                },
+                "TA0004: Privilege Escalation",
+                "TA0005: (Name not found)",
+            ),
+            (
+                "mitigations",
+                {
+                    "id": "M1040",
+                    "name": "Behavior Prevention on Endpoint",
+                    "description": "Use capabilities to prevent suspicious behavior patterns.",
+                },
+                "M1040: Behavior Prevention on Endpoint",
+                "M1026: (Name not found)",
+            ),
+        ],
+        ids=["missing_tactic_names", "missing_mitigation_names"],
+    )
+    def test_format_technique_response_missing_names(
+        self, section, kept_entry, present, missing
+    ):
+        """Test formatting when referenced tactic or mitigation names are not found."""
+        # Replace one section with a single entry; the other referenced ID is missing
+        partial_data = {**self.sample_data, section: [kept_entry]}
 
         technique = self.sample_data["techniques"][0]  # T1055
-        response = _format_technique_response(technique, data_missing_mitigation)
+        response = _format_technique_response(technique, partial_data)
 
-        assert "M1040: Behavior Prevention on Endpoint" in response
-        assert "M1026: (Name not found)" in response
+        assert present in response
+        assert missing in response
 
     def test_format_technique_response_no_tactics(self):
         """Test formatting technique with no tactics."""
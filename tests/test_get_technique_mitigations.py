@@ -6,11 +6,6 @@ including mitigation retrieval, error handling, and data validation.
 """
 
 import pytest
-import asyncio
-from unittest.mock import Mock, patch
-from mcp.types import TextContent
-from src.mcp_server import create_mcp_server
-from src.data_loader import DataLoader
 
 
 def _get_technique_by_id(technique_id: str, data: dict) -> dict:
@@ -5,8 +5,6 @@ This module contains tests for understanding and analyzing the HTTP interface
 of the FastMCP server implementation.
 """
 
-import asyncio
-import json
 import logging
 import pytest
 from src.mcp_server import create_mcp_server
@@ -6,8 +6,6 @@ including tactics listing, formatting, and edge cases.
 """
 
 import pytest
-from unittest.mock import Mock
-from src.data_loader import DataLoader
 
 
 def _get_all_tactics(data: dict) -> list:
@@ -6,10 +6,14 @@ including tool registration and basic request handling.
 """
 
 import pytest
-import asyncio
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 from src.mcp_server import MCPServer, create_mcp_server
-from src.data_loader import DataLoader
+
+
+def _stub_data_loader():
+    """Plain stand-in for DataLoader; these tests only store it on the server."""
+    return SimpleNamespace(get_cached_data=lambda *_: None)
 
 
 class TestMCPServer:
@@ -17,28 +21,28 @@ class TestMCPServer:
 
     def test_mcp_server_initialization(self):
         """Test that MCP server initializes correctly."""
-        # Mock data loader to avoid actual data loading in tests
-        mock_data_loader = Mock(spec=DataLoader)
+        # Stub data loader to avoid actual data loading in tests
+        mock_data_loader = _stub_data_loader()
 
         # Initialize MCP server
         server = MCPServer(mock_data_loader)
 
         # Verify server is created
         assert server is not None
-        assert server.data_loader == mock_data_loader
+        assert server.data_loader is mock_data_loader
         assert server.app is not None
         assert server.app.name == "mitre-attack-mcp-server"
 
     def test_create_mcp_server_function(self):
         """Test the create_mcp_server function."""
-        mock_data_loader = Mock(spec=DataLoader)
+        mock_data_loader = _stub_data_loader()
 
         app = create_mcp_server(mock_data_loader)
 
         assert app is not None
         assert app.name == "mitre-attack-mcp-server"
         assert hasattr(app, "data_loader")
-        assert app.data_loader == mock_data_loader
+        assert app.data_loader is mock_data_loader
 
     @patch("src.mcp_server.ConfigLoader")
     def test_tools_registration(self, mock_config_loader):
@@ -55,7 +59,7 @@ class TestMCPServer:
             }
         }
 
-        mock_data_loader = Mock(spec=DataLoader)
+        mock_data_loader = _stub_data_loader()
         server = MCPServer(mock_data_loader)
 
         # Verify server was created successfully
@@ -63,16 +67,16 @@ class TestMCPServer:
 
     def test_server_has_data_loader_attribute(self):
         """Test that the server stores the data loader correctly."""
-        mock_data_loader = Mock(spec=DataLoader)
+        mock_data_loader = _stub_data_loader()
         app = create_mcp_server(mock_data_loader)
 
         # Verify the data loader is stored
         assert hasattr(app, "data_loader")
-        assert app.data_loader == mock_data_loader
+        assert app.data_loader is mock_data_loader
 
     def test_server_name_and_instructions(self):
         """Test that the server has correct name and instructions."""
-        mock_data_loader = Mock(spec=DataLoader)
+        mock_data_loader = _stub_data_loader()
         app = create_mcp_server(mock_data_loader)
 
         # Verify server configuration
@@ -81,7 +85,7 @@ class TestMCPServer:
 
     def test_server_configuration(self):
         """Test that the server is configured correctly."""
-        mock_data_loader = Mock(spec=DataLoader)
+        mock_data_loader = _stub_data_loader()
         app = create_mcp_server(mock_data_loader)
 
         # Verify server is properly configured
@@ -7,11 +7,10 @@ backward compatibility.
 """
 
 import pytest
-import uuid
 from unittest.mock import Mock, patch
 
 import stix2
-from stix2.exceptions import STIXError, InvalidValueError, MissingPropertiesError
+from stix2.exceptions import STIXError, InvalidValueError
 
 from src.parsers.stix_parser import STIXParser
 
@@ -12,10 +12,9 @@ import tracemalloc
 import psutil
 import os
 import uuid
-from typing import Dict, List, Any, Tuple, Optional
-from unittest.mock import patch, MagicMock
+from typing import Dict, List, Any, Tuple
+from unittest.mock import patch
 import pytest
-import requests
 
 from src.parsers.stix_parser import STIXParser
 from src.data_loader import DataLoader
@@ -421,7 +420,8 @@ def performance_benchmark():
     return PerformanceBenchmark()
 
 
-@pytest.fixture
+# Datasets are read-only parser inputs, so each size is generated once per module
+@pytest.fixture(scope="module")
 def small_stix_dataset():
     """Fixture providing a small STIX dataset for quick tests."""
     benchmark = PerformanceBenchmark()
@@ -430,7 +430,7 @@ def small_stix_dataset():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def medium_stix_dataset():
     """Fixture providing a medium STIX dataset for moderate performance tests."""
     benchmark = PerformanceBenchmark()
@@ -439,7 +439,7 @@ def medium_stix_dataset():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_stix_dataset():
     """Fixture providing a large STIX dataset for stress testing."""
     benchmark = PerformanceBenchmark()
@@ -505,6 +505,7 @@ class TestParsingPerformance:
             stix2_success or main_success
         ), "At least one parsing method should succeed"
 
+    @pytest.mark.slow
     def test_medium_dataset_performance(
         self, performance_benchmark, medium_stix_dataset
     ):
@@ -745,7 +746,7 @@ class TestMemoryUsageOptimization:
 class TestRealDataPerformance:
     """Test performance with real MITRE ATT&CK data."""
 
-    @pytest.mark.integration
+    @pytest.mark.slow
     def test_real_mitre_attack_performance(self, performance_benchmark):
         """Test performance with real MITRE ATT&CK data (integration test)."""
         logger.info("Testing performance with real MITRE ATT&CK data")
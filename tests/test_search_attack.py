@@ -6,10 +6,7 @@ including search logic, result formatting, and edge cases.
 """
 
 import pytest
-import asyncio
-from unittest.mock import Mock, patch
-from src.mcp_server import _search_entities, create_mcp_server
-from src.data_loader import DataLoader
+from src.mcp_server import _search_entities
 
 
 class TestSearchAttack:
@@ -266,10 +263,6 @@ class TestSearchAttackMCPTool:
 
     def test_search_attack_integration_with_data(self, sample_data):
         """Test search_attack integration with actual data."""
-        # Create mock data loader
-        mock_loader = Mock(spec=DataLoader)
-        mock_loader.get_cached_data.return_value = sample_data
-
         # Test the search function directly with the data structure
         results = _search_entities("apt29", sample_data)
 
@@ -6,14 +6,9 @@ MissingPropertiesError, and graceful degradation when STIX objects fail validati
 """
 
 import unittest
-from unittest.mock import patch, Mock, MagicMock
-import sys
-import os
+from unittest.mock import Mock
 import pytest
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 import stix2
 from stix2.exceptions import (
     STIXError,
@@ -33,6 +28,17 @@ class TestSTIXErrorHandling(unittest.TestCase):
         """Set up test fixtures."""
         self.parser = STIXParser()
 
+    @pytest.fixture(autouse=True)
+    def _use_monkeypatch(self, monkeypatch):
+        """Expose pytest's monkeypatch so parser methods are swapped with one finalizer."""
+        self.monkeypatch = monkeypatch
+
+    def _mock_logger(self):
+        """Swap the parser module's logger for a plain Mock and return it."""
+        mock_logger = Mock()
+        self.monkeypatch.setattr("src.parsers.stix_parser.logger", mock_logger)
+        return mock_logger
+
     def test_stix_error_handling_in_bundle_parsing(self):
         """Test handling of STIXError during bundle parsing."""
         malformed_bundle = {
@@ -41,11 +47,12 @@ class TestSTIXErrorHandling(unittest.TestCase):
             "objects": [],
         }
 
-        with patch("stix2.Bundle") as mock_bundle:
-            mock_bundle.side_effect = STIXError("Invalid bundle ID format")
+        self.monkeypatch.setattr(
+            "stix2.Bundle", Mock(side_effect=STIXError("Invalid bundle ID format"))
+        )
 
-            with pytest.raises(STIXError):
-                self.parser._parse_stix_bundle_with_validation(malformed_bundle)
+        with pytest.raises(STIXError):
+            self.parser._parse_stix_bundle_with_validation(malformed_bundle)
 
     def test_invalid_value_error_handling_in_bundle_parsing(self):
         """Test handling of InvalidValueError during bundle parsing."""
@@ -56,13 +63,17 @@ class TestSTIXErrorHandling(unittest.TestCase):
             "objects": [],
         }
 
-        with patch("stix2.Bundle") as mock_bundle:
-            mock_bundle.side_effect = InvalidValueError(
-                "Bundle", "spec_version", "Invalid version format"
-            )
+        self.monkeypatch.setattr(
+            "stix2.Bundle",
+            Mock(
+                side_effect=InvalidValueError(
+                    "Bundle", "spec_version", "Invalid version format"
+                )
+            ),
+        )
 
-            with pytest.raises(InvalidValueError):
-                self.parser._parse_stix_bundle_with_validation(invalid_bundle)
+        with pytest.raises(InvalidValueError):
+            self.parser._parse_stix_bundle_with_validation(invalid_bundle)
 
     def test_missing_properties_error_handling_in_bundle_parsing(self):
         """Test handling of MissingPropertiesError during bundle parsing."""
@@ -73,14 +84,16 @@ class TestSTIXErrorHandling(unittest.TestCase):
         }
 
         # Mock the Bundle constructor to raise MissingPropertiesError
-        with patch("src.parsers.stix_parser.Bundle") as mock_bundle:
-            # Create a proper MissingPropertiesError with a class object
-            from stix2.v21.bundle import Bundle
+        # Create a proper MissingPropertiesError with a class object
+        from stix2.v21.bundle import Bundle
 
-            mock_bundle.side_effect = MissingPropertiesError(Bundle, ["id"])
+        self.monkeypatch.setattr(
+            "src.parsers.stix_parser.Bundle",
+            Mock(side_effect=MissingPropertiesError(Bundle, ["id"])),
+        )
 
-            with pytest.raises(MissingPropertiesError):
-                self.parser._parse_stix_bundle_with_validation(incomplete_bundle)
+        with pytest.raises(MissingPropertiesError):
+            self.parser._parse_stix_bundle_with_validation(incomplete_bundle)
 
     def test_graceful_degradation_with_individual_object_errors(self):
         """Test graceful degradation when individual STIX objects fail validation."""
@@ -109,16 +122,17 @@ class TestSTIXErrorHandling(unittest.TestCase):
         }
 
         # Mock the bundle parsing to succeed but individual object parsing to fail for second object
-        with patch.object(
-            self.parser, "_parse_stix_bundle_with_validation"
-        ) as mock_parse_bundle:
-            mock_parse_bundle.return_value = mixed_bundle["objects"]
-
-            with patch.object(
-                self.parser, "_extract_entity_from_stix_object_with_validation"
-            ) as mock_extract:
-                # First call succeeds, second call raises STIXError
-                mock_extract.side_effect = [
+        self.monkeypatch.setattr(
+            self.parser,
+            "_parse_stix_bundle_with_validation",
+            Mock(return_value=mixed_bundle["objects"]),
+        )
+        # First call succeeds, second call raises STIXError
+        self.monkeypatch.setattr(
+            self.parser,
+            "_extract_entity_from_stix_object_with_validation",
+            Mock(
+                side_effect=[
                     {
                         "id": "T1055",
                         "name": "Valid Technique",
@@ -126,14 +140,14 @@ class TestSTIXErrorHandling(unittest.TestCase):
                     },
                     STIXError("Invalid object ID format"),
                 ]
+            ),
+        )
 
-                result = self.parser._parse_with_stix2_library(
-                    mixed_bundle, ["techniques"]
-                )
+        result = self.parser._parse_with_stix2_library(mixed_bundle, ["techniques"])
 
-                # Should have extracted only the valid technique
-                self.assertEqual(len(result["techniques"]), 1)
-                self.assertEqual(result["techniques"][0]["id"], "T1055")
+        # Should have extracted only the valid technique
+        self.assertEqual(len(result["techniques"]), 1)
+        self.assertEqual(result["techniques"][0]["id"], "T1055")
 
     def test_stix_error_logging_with_context(self):
         """Test that STIX errors are logged with proper context information."""
@@ -143,29 +157,31 @@ class TestSTIXErrorHandling(unittest.TestCase):
             "name": "Test Technique",
         }
 
-        with patch("src.parsers.stix_parser.logger") as mock_logger:
-            with patch.object(
-                self.parser, "_extract_entity_from_stix_object_with_validation"
-            ) as mock_extract:
-                mock_extract.side_effect = STIXError("Invalid object format")
+        self.monkeypatch.setattr(
+            self.parser,
+            "_extract_entity_from_stix_object_with_validation",
+            Mock(side_effect=STIXError("Invalid object format")),
+        )
 
-                result = self.parser._parse_with_stix2_library(
-                    {
-                        "type": "bundle",
-                        "id": "bundle--55fe156d-93f5-40bd-9970-86398dc421be",
-                        "objects": [invalid_object],
-                    },
-                    ["techniques"],
-                )
+        mock_logger = self._mock_logger()
 
-                # Verify error was logged with context
-                mock_logger.debug.assert_called()
-                debug_calls = [
-                    call
-                    for call in mock_logger.debug.call_args_list
-                    if "STIX format error" in str(call)
-                ]
-                self.assertTrue(len(debug_calls) > 0)
+        result = self.parser._parse_with_stix2_library(
+            {
+                "type": "bundle",
+                "id": "bundle--55fe156d-93f5-40bd-9970-86398dc421be",
+                "objects": [invalid_object],
+            },
+            ["techniques"],
+        )
+
+        # Verify error was logged with context
+        mock_logger.debug.assert_called()
+        debug_calls = [
+            call
+            for call in mock_logger.debug.call_args_list
+            if "STIX format error" in str(call)
+        ]
+        self.assertTrue(len(debug_calls) > 0)
 
     def test_invalid_value_error_in_entity_extraction(self):
         """Test handling of InvalidValueError during entity extraction."""
@@ -176,19 +192,22 @@ class TestSTIXErrorHandling(unittest.TestCase):
             "x_mitre_platforms": "invalid_platforms_format",  # Should be list, not string
         }
 
-        with patch.object(
-            self.parser, "_extract_technique_data_from_stix_object_with_validation"
-        ) as mock_extract:
-            mock_extract.side_effect = InvalidValueError(
-                "AttackPattern", "x_mitre_platforms", "Expected list"
-            )
+        self.monkeypatch.setattr(
+            self.parser,
+            "_extract_technique_data_from_stix_object_with_validation",
+            Mock(
+                side_effect=InvalidValueError(
+                    "AttackPattern", "x_mitre_platforms", "Expected list"
+                )
+            ),
+        )
 
-            result = self.parser._extract_entity_from_stix_object_with_validation(
-                technique_object, "techniques"
-            )
+        result = self.parser._extract_entity_from_stix_object_with_validation(
+            technique_object, "techniques"
+        )
 
-            # Should return None due to validation error
-            self.assertIsNone(result)
+        # Should return None due to validation error
+        self.assertIsNone(result)
 
     def test_missing_properties_error_in_entity_extraction(self):
         """Test handling of MissingPropertiesError during entity extraction."""
@@ -199,15 +218,16 @@ class TestSTIXErrorHandling(unittest.TestCase):
             "description": "A technique without a name",
         }
 
-        with patch.object(
-            self.parser, "_validate_stix_object_structure", return_value=True
-        ):
-            result = self.parser._extract_entity_from_stix_object_with_validation(
-                incomplete_technique, "techniques"
-            )
+        self.monkeypatch.setattr(
+            self.parser, "_validate_stix_object_structure", Mock(return_value=True)
+        )
+
+        result = self.parser._extract_entity_from_stix_object_with_validation(
+            incomplete_technique, "techniques"
+        )
 
-            # Should return None due to missing name
-            self.assertIsNone(result)
+        # Should return None due to missing name
+        self.assertIsNone(result)
 
     def test_extra_properties_error_handling(self):
         """Test handling of ExtraPropertiesError during parsing."""
@@ -228,27 +248,24 @@ class TestSTIXErrorHandling(unittest.TestCase):
             "objects": [technique_with_extra_props],
         }
 
-        with patch.object(
-            self.parser, "_parse_stix_bundle_with_validation"
-        ) as mock_parse_bundle:
-            mock_parse_bundle.return_value = [technique_with_extra_props]
-
-            with patch.object(
-                self.parser, "_extract_entity_from_stix_object_with_validation"
-            ) as mock_extract:
-                # Create a proper ExtraPropertiesError with a class object
-                from stix2.v21.sdo import AttackPattern
+        # Create a proper ExtraPropertiesError with a class object
+        from stix2.v21.sdo import AttackPattern
 
-                mock_extract.side_effect = ExtraPropertiesError(
-                    AttackPattern, ["custom_property"]
-                )
+        self.monkeypatch.setattr(
+            self.parser,
+            "_parse_stix_bundle_with_validation",
+            Mock(return_value=[technique_with_extra_props]),
+        )
+        self.monkeypatch.setattr(
+            self.parser,
+            "_extract_entity_from_stix_object_with_validation",
+            Mock(side_effect=ExtraPropertiesError(AttackPattern, ["custom_property"])),
+        )
 
-                result = self.parser._parse_with_stix2_library(
-                    bundle_data, ["techniques"]
-                )
+        result = self.parser._parse_with_stix2_library(bundle_data, ["techniques"])
 
-                # Should handle error gracefully and return empty results
-                self.assertEqual(len(result["techniques"]), 0)
+        # Should handle error gracefully and return empty results
+        self.assertEqual(len(result["techniques"]), 0)
 
     def test_parse_error_handling(self):
         """Test handling of ParseError during STIX parsing."""
@@ -263,22 +280,21 @@ class TestSTIXErrorHandling(unittest.TestCase):
             ],
         }
 
-        with patch.object(
-            self.parser, "_parse_stix_bundle_with_validation"
-        ) as mock_parse_bundle:
-            mock_parse_bundle.return_value = malformed_json["objects"]
-
-            with patch.object(
-                self.parser, "_extract_entity_from_stix_object_with_validation"
-            ) as mock_extract:
-                mock_extract.side_effect = ParseError("Malformed JSON in STIX object")
+        self.monkeypatch.setattr(
+            self.parser,
+            "_parse_stix_bundle_with_validation",
+            Mock(return_value=malformed_json["objects"]),
+        )
+        self.monkeypatch.setattr(
+            self.parser,
+            "_extract_entity_from_stix_object_with_validation",
+            Mock(side_effect=ParseError("Malformed JSON in STIX object")),
+        )
 
-                result = self.parser._parse_with_stix2_library(
-                    malformed_json, ["techniques"]
-                )
+        result = self.parser._parse_with_stix2_library(malformed_json, ["techniques"])
 
-                # Should handle parse error gracefully
-                self.assertEqual(len(result["techniques"]), 0)
+        # Should handle parse error gracefully
+        self.assertEqual(len(result["techniques"]), 0)
 
     def test_error_summary_logging(self):
         """Test that error summary is properly logged with breakdown by error type."""
@@ -300,37 +316,41 @@ class TestSTIXErrorHandling(unittest.TestCase):
             ],
         }
 
-        with patch.object(
-            self.parser, "_parse_stix_bundle_with_validation"
-        ) as mock_parse_bundle:
-            mock_parse_bundle.return_value = bundle_with_various_errors["objects"]
-
-            with patch.object(
-                self.parser, "_extract_entity_from_stix_object_with_validation"
-            ) as mock_extract:
-                # Create proper STIX error objects with class references
-                from stix2.v21.sdo import AttackPattern
+        # Create proper STIX error objects with class references
+        from stix2.v21.sdo import AttackPattern
 
-                mock_extract.side_effect = [
+        self.monkeypatch.setattr(
+            self.parser,
+            "_parse_stix_bundle_with_validation",
+            Mock(return_value=bundle_with_various_errors["objects"]),
+        )
+        self.monkeypatch.setattr(
+            self.parser,
+            "_extract_entity_from_stix_object_with_validation",
+            Mock(
+                side_effect=[
                     STIXError("STIX format error"),
                     InvalidValueError(AttackPattern, "property", "Invalid value"),
                     MissingPropertiesError(AttackPattern, ["name"]),
                     ExtraPropertiesError(AttackPattern, ["extra_prop"]),
                     ParseError("Parse error"),
                 ]
+            ),
+        )
+
+        mock_logger = self._mock_logger()
 
-                with patch("src.parsers.stix_parser.logger") as mock_logger:
-                    result = self.parser._parse_with_stix2_library(
-                        bundle_with_various_errors, ["techniques"]
-                    )
+        result = self.parser._parse_with_stix2_library(
+            bundle_with_various_errors, ["techniques"]
+        )
 
-                    # Verify error summary was logged
-                    info_calls = [
-                        call
-                        for call in mock_logger.info.call_args_list
-                        if "Error breakdown" in str(call)
-                    ]
-                    self.assertTrue(len(info_calls) > 0)
+        # Verify error summary was logged
+        info_calls = [
+            call
+            for call in mock_logger.info.call_args_list
+            if "Error breakdown" in str(call)
+        ]
+        self.assertTrue(len(info_calls) > 0)
 
     def test_stix_object_type_extraction_error_handling(self):
         """Test error handling in STIX object type extraction."""
@@ -436,21 +456,21 @@ class TestSTIXErrorHandling(unittest.TestCase):
         }
 
         # Mock the bundle parsing to return our test objects
-        with patch.object(
-            self.parser, "_parse_stix_bundle_with_validation"
-        ) as mock_parse_bundle:
-            mock_parse_bundle.return_value = [
-                valid_technique,
-                invalid_technique_1,
-                invalid_technique_2,
-            ]
+        self.monkeypatch.setattr(
+            self.parser,
+            "_parse_stix_bundle_with_validation",
+            Mock(
+                return_value=[valid_technique, invalid_technique_1, invalid_technique_2]
+            ),
+        )
 
-            # Mock entity extraction to simulate different error types
-            with patch.object(
-                self.parser, "_extract_entity_from_stix_object_with_validation"
-            ) as mock_extract:
-                # First call succeeds, second and third fail with different errors
-                mock_extract.side_effect = [
+        # Mock entity extraction to simulate different error types:
+        # first call succeeds, second and third fail with different errors
+        self.monkeypatch.setattr(
+            self.parser,
+            "_extract_entity_from_stix_object_with_validation",
+            Mock(
+                side_effect=[
                     {
                         "id": "T1055",
                         "name": "Valid Technique",
@@ -461,20 +481,20 @@ class TestSTIXErrorHandling(unittest.TestCase):
                         stix2.v21.sdo.AttackPattern, "property", "Invalid value"
                     ),
                 ]
+            ),
+        )
 
-                bundle_data = {
-                    "type": "bundle",
-                    "id": "bundle--34c90093-7826-4441-a345-56ade5141173",
-                    "objects": [],
-                }
-                result = self.parser._parse_with_stix2_library(
-                    bundle_data, ["techniques"]
-                )
+        bundle_data = {
+            "type": "bundle",
+            "id": "bundle--34c90093-7826-4441-a345-56ade5141173",
+            "objects": [],
+        }
+        result = self.parser._parse_with_stix2_library(bundle_data, ["techniques"])
 
-                # Should have extracted only the valid technique
-                self.assertEqual(len(result["techniques"]), 1)
-                self.assertEqual(result["techniques"][0]["id"], "T1055")
-                self.assertEqual(result["techniques"][0]["name"], "Valid Technique")
+        # Should have extracted only the valid technique
+        self.assertEqual(len(result["techniques"]), 1)
+        self.assertEqual(result["techniques"][0]["id"], "T1055")
+        self.assertEqual(result["techniques"][0]["name"], "Valid Technique")
 
 
 if __name__ == "__main__":
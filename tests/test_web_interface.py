@@ -5,15 +5,11 @@ This module contains tests for verifying the web interface can properly
 communicate with the MCP server via HTTP requests.
 """
 
-import asyncio
-import json
 import aiohttp
 import logging
 import pytest
-import threading
-import time
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from src.mcp_server import create_mcp_server
 from src.data_loader import DataLoader
 
@@ -27,59 +23,65 @@ MCP_HTTP_PORT = int(os.getenv("MCP_HTTP_PORT", "8000"))
 MCP_HTTP_URL = f"http://{MCP_HTTP_HOST}:{MCP_HTTP_PORT}"
 
 
+# The server only reads from the mock loader, so one instance serves every test
+@pytest.fixture(scope="session")
+def mock_data_loader():
+    """Create a mock data loader with sample data for testing."""
+    mock_loader = Mock(spec=DataLoader)
+
+    # Sample test data
+    sample_data = {
+        "tactics": [
+            {
+                "id": "TA0001",
+                "name": "Initial Access",
+                "description": "The adversary is trying to get into your network.",
+            }
+        ],
+        "techniques": [
+            {
+                "id": "T1055",
+                "name": "Process Injection",
+                "description": "Adversaries may inject code into processes.",
+                "tactics": ["TA0002"],
+                "platforms": ["Windows", "Linux"],
+                "mitigations": ["M1040"],
+            }
+        ],
+        "groups": [
+            {
+                "id": "G0016",
+                "name": "APT29",
+                "aliases": ["Cozy Bear"],
+                "description": "APT29 is a threat group.",
+                "techniques": ["T1055"],
+            }
+        ],
+        "mitigations": [
+            {
+                "id": "M1040",
+                "name": "Behavior Prevention on Endpoint",
+                "description": "Use capabilities to prevent suspicious behavior patterns.",
+            }
+        ],
+    }
+
+    mock_loader.get_cached_data.return_value = sample_data
+    return mock_loader
+
+
+@pytest.fixture(scope="session")
+def app(mock_data_loader):
+    """MCP server built once over the mock data loader."""
+    return create_mcp_server(mock_data_loader)
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestWebInterface:
     """Test cases for web interface HTTP communication."""
 
-    @pytest.fixture
-    def mock_data_loader(self):
-        """Create a mock data loader with sample data for testing."""
-        mock_loader = Mock(spec=DataLoader)
-
-        # Sample test data
-        sample_data = {
-            "tactics": [
-                {
-                    "id": "TA0001",
-                    "name": "Initial Access",
-                    "description": "The adversary is trying to get into your network.",
-                }
-            ],
-            "techniques": [
-                {
-                    "id": "T1055",
-                    "name": "Process Injection",
-                    "description": "Adversaries may inject code into processes.",
-                    "tactics": ["TA0002"],
-                    "platforms": ["Windows", "Linux"],
-                    "mitigations": ["M1040"],
-                }
-            ],
-            "groups": [
-                {
-                    "id": "G0016",
-                    "name": "APT29",
-                    "aliases": ["Cozy Bear"],
-                    "description": "APT29 is a threat group.",
-                    "techniques": ["T1055"],
-                }
-            ],
-            "mitigations": [
-                {
-                    "id": "M1040",
-                    "name": "Behavior Prevention on Endpoint",
-                    "description": "Use capabilities to prevent suspicious behavior patterns.",
-                }
-            ],
-        }
-
-        mock_loader.get_cached_data.return_value = sample_data
-        return mock_loader
-
-    @pytest.mark.asyncio
-    async def test_json_rpc_tools_list_format(self, mock_data_loader):
+    async def test_json_rpc_tools_list_format(self, app):
         """Test that JSON-RPC tools/list request format is correct."""
-        app = create_mcp_server(mock_data_loader)
-
         # Test the internal method that would handle tools/list
         tools = await app.list_tools()
 
@@ -93,68 +95,54 @@ class TestWebInterface:
             assert hasattr(tool, "inputSchema")
             assert isinstance(tool.inputSchema, dict)
 
-    @pytest.mark.asyncio
-    async def test_json_rpc_tool_call_format(self, mock_data_loader):
-        """Test that JSON-RPC tools/call request format is correct."""
-        app = create_mcp_server(mock_data_loader)
-
-        # Test list_tactics tool call
-        result, _ = await app.call_tool("list_tactics", {})
-
-        assert result is not None
-        assert len(result) > 0
-        assert result[0].type == "text"
-        assert isinstance(result[0].text, str)
-        assert len(result[0].text) > 0
-
-    @pytest.mark.asyncio
-    async def test_search_tool_with_parameters(self, mock_data_loader):
-        """Test search tool with parameters as web interface would use."""
-        app = create_mcp_server(mock_data_loader)
-
-        # Test search_attack tool call with query parameter
-        result, _ = await app.call_tool("search_attack", {"query": "process"})
-
-        assert result is not None
-        assert len(result) > 0
-        assert result[0].type == "text"
-        assert "process" in result[0].text.lower()
-
-    @pytest.mark.asyncio
-    async def test_technique_detail_tool(self, mock_data_loader):
-        """Test technique detail tool as web interface would use."""
-        app = create_mcp_server(mock_data_loader)
-
-        # Test get_technique tool call
-        result, _ = await app.call_tool("get_technique", {"technique_id": "T1055"})
+    @pytest.mark.parametrize(
+        "tool_name, arguments, expected, expected_lower",
+        [
+            pytest.param("list_tactics", {}, (), (), id="tool_call_format"),
+            pytest.param(
+                "search_attack",
+                {"query": "process"},
+                (),
+                ("process",),
+                id="search_with_parameters",
+            ),
+            pytest.param(
+                "get_technique",
+                {"technique_id": "T1055"},
+                ("T1055", "Process Injection"),
+                (),
+                id="technique_detail",
+            ),
+            pytest.param(
+                "get_technique",
+                {"technique_id": "INVALID"},
+                (),
+                ("not found",),
+                id="error_handling",
+            ),
+        ],
+    )
+    async def test_tool_call_as_web_interface_would(
+        self, app, tool_name, arguments, expected, expected_lower
+    ):
+        """Test JSON-RPC tools/call responses as the web interface consumes them."""
+        result, _ = await app.call_tool(tool_name, arguments)
 
         assert result is not None
         assert len(result) > 0
         assert result[0].type == "text"
-        assert "T1055" in result[0].text
-        assert "Process Injection" in result[0].text
+        text = result[0].text
+        assert isinstance(text, str)
+        assert len(text) > 0
 
-    @pytest.mark.asyncio
-    async def test_error_handling_for_web_interface(self, mock_data_loader):
-        """Test error handling as web interface would encounter."""
-        app = create_mcp_server(mock_data_loader)
+        lowered = text.lower()
+        missing = [s for s in expected if s not in text]
+        missing += [s for s in expected_lower if s not in lowered]
+        assert not missing, f"{tool_name} response missing: {missing}"
 
-        # Test with invalid technique ID
-        result, _ = await app.call_tool("get_technique", {"technique_id": "INVALID"})
-
-        assert result is not None
-        assert len(result) > 0
-        assert result[0].type == "text"
-        assert "not found" in result[0].text.lower()
-
-    def test_web_interface_tool_parameters(self, mock_data_loader):
+    async def test_web_interface_tool_parameters(self, app):
         """Test that tool parameters match web interface expectations."""
-        app = create_mcp_server(mock_data_loader)
-
-        # Get tools synchronously for parameter validation
-        import asyncio
-
-        tools = asyncio.run(app.list_tools())
+        tools = await app.list_tools()
         tool_dict = {tool.name: tool for tool in tools}
 
         # Verify search_attack parameters
@@ -181,7 +169,6 @@ class TestWebInterfaceIntegration:
     """Integration tests for web interface with actual HTTP requests."""
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_http_request_format(self):
         """Test actual HTTP request format (requires running server)."""
         # This test would require a running server
@@ -202,7 +189,6 @@ class TestWebInterfaceIntegration:
                 pytest.skip(f"MCP server not running on {MCP_HTTP_URL}")
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_tool_call_http_format(self):
         """Test actual tool call HTTP format (requires running server)."""
         pytest.skip("Integration test requires running MCP server")
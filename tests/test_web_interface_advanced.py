@@ -6,212 +6,164 @@ This module tests the web interface components that support advanced threat mode
 including the HTML structure, CSS styling, JavaScript functions, and HTTP proxy integration.
 """
 
-import os
 import pytest
 from pathlib import Path
 
+# Resolved once at import instead of rebuilding the path in every test
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WEB_EXPLORER_HTML = REPO_ROOT / "web_explorer.html"
+HTTP_PROXY_PY = REPO_ROOT / "http_proxy.py"
+START_EXPLORER_PY = REPO_ROOT / "start_explorer.py"
+
+REQUIRED_JS_FUNCTIONS = (
+    "runDemo",
+    "runCustomQuery",
+    "switchTab",
+    "updateCustomForm",
+    "checkConnection",
+)
+
+FORM_INDICATORS = (
+    "start_tactic",
+    "end_tactic",
+    "threat_groups",
+    "technique_id_rel",
+    "toolSelect",
+    "build_attack_path",
+    "analyze_coverage_gaps",
+    "detect_technique_relationships",
+)
+DEMO_CONFIG_INDICATORS = (
+    "attack_path:",
+    "coverage_gaps:",
+    "technique_relationships:",
+)
+SCHEMA_INDICATORS = (
+    "start_tactic",
+    "end_tactic",
+    "threat_groups",
+    "technique_id",
+    '"type": "array"',
+    '"items": {"type": "string"}',
+)
+
+
+# (content fixture, required substring, failure message) for checks that only
+# need a substring to be present; each row is reported as its own test
+CONTENT_CHECKS = (
+    # Advanced tools section in the tabbed interface and its tool demos
+    ("html_content", "Advanced Analysis", "Advanced Analysis tab not found"),
+    ("html_content", "Attack Path Analysis", "Attack Path Analysis demo not found"),
+    ("html_content", "Coverage Gap Analysis", "Coverage Gap Analysis demo not found"),
+    ("html_content", "Relationship Discovery", "Relationship Discovery demo not found"),
+    ("html_content", "build_attack_path", "build_attack_path tool not found"),
+    ("html_content", "analyze_coverage_gaps", "analyze_coverage_gaps tool not found"),
+    (
+        "html_content",
+        "detect_technique_relationships",
+        "detect_technique_relationships tool not found",
+    ),
+    # CSS classes used by the new interface
+    ("html_content", ".demo-card", "Demo card CSS class not found"),
+    ("html_content", ".tab-content", "Tab content CSS not found"),
+    ("html_content", ".custom-input-section", "Custom input section CSS not found"),
+    ("html_content", ".input-group", "Input group CSS not found"),
+    # Modern styling, responsive design and interaction features
+    ("html_content", "var(--", "CSS custom properties not found"),
+    ("html_content", "linear-gradient", "Gradient styling not found"),
+    ("html_content", "border-radius", "Modern border radius not found"),
+    ("html_content", "box-shadow", "Modern shadows not found"),
+    ("html_content", "@media", "Responsive media queries not found"),
+    ("html_content", "grid-template-columns", "CSS Grid not found"),
+    ("html_content", "flex", "Flexbox not found"),
+    ("html_content", "transition:", "CSS transitions not found"),
+    ("html_content", "transform:", "CSS transforms not found"),
+    ("html_content", ":hover", "Hover effects not found"),
+    # Advanced tool definitions and descriptions in the HTTP proxy
+    ("proxy_content", "build_attack_path", "build_attack_path not found in HTTP proxy"),
+    (
+        "proxy_content",
+        "analyze_coverage_gaps",
+        "analyze_coverage_gaps not found in HTTP proxy",
+    ),
+    (
+        "proxy_content",
+        "detect_technique_relationships",
+        "detect_technique_relationships not found in HTTP proxy",
+    ),
+    ("proxy_content", "multi-stage attack paths", "Attack path description not found"),
+    ("proxy_content", "coverage gaps", "Coverage gaps description not found"),
+    ("proxy_content", "STIX relationships", "STIX relationships description not found"),
+    # start_explorer.py compatibility with the async proxy
+    ("script_content", "async def", "Async functions not found in start_explorer.py"),
+    (
+        "script_content",
+        "create_http_proxy_server",
+        "create_http_proxy_server import not found",
+    ),
+    ("script_content", "aiohttp", "aiohttp dependency check not found"),
+)
+
+
+# The files are static for the run, so each is read and decoded only once
+@pytest.fixture(scope="session")
+def html_content():
+    """Contents of web_explorer.html."""
+    return WEB_EXPLORER_HTML.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def proxy_content():
+    """Contents of http_proxy.py."""
+    return HTTP_PROXY_PY.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def script_content():
+    """Contents of start_explorer.py."""
+    return START_EXPLORER_PY.read_text(encoding="utf-8")
+
 
 class TestWebInterfaceAdvanced:
     """Test advanced web interface functionality."""
 
-    def test_web_explorer_html_contains_advanced_section(self):
-        """Test that web_explorer.html contains advanced tools section."""
-        # Use relative path that works in both local and CI environments
-        html_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "web_explorer.html"
-        )
-
-        with open(html_path, "r") as f:
-            html_content = f.read()
-
-        # Check for advanced tools section in the new tabbed interface
-        assert "Advanced Analysis" in html_content, "Advanced Analysis tab not found"
-        assert (
-            "Attack Path Analysis" in html_content
-        ), "Attack Path Analysis demo not found"
-        assert (
-            "Coverage Gap Analysis" in html_content
-        ), "Coverage Gap Analysis demo not found"
-        assert (
-            "Relationship Discovery" in html_content
-        ), "Relationship Discovery demo not found"
-
-        # Check for advanced tool demos
-        assert "build_attack_path" in html_content, "build_attack_path tool not found"
-        assert (
-            "analyze_coverage_gaps" in html_content
-        ), "analyze_coverage_gaps tool not found"
-        assert (
-            "detect_technique_relationships" in html_content
-        ), "detect_technique_relationships tool not found"
-
-    def test_web_explorer_html_contains_advanced_css(self):
-        """Test that web_explorer.html contains CSS for advanced tools."""
-        # Use relative path that works in both local and CI environments
-        html_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "web_explorer.html"
-        )
-
-        with open(html_path, "r") as f:
-            html_content = f.read()
-
-        # Check for modern CSS classes used in the new interface
-        assert ".demo-card" in html_content, "Demo card CSS class not found"
-        assert ".tab-content" in html_content, "Tab content CSS not found"
-        assert (
-            ".custom-input-section" in html_content
-        ), "Custom input section CSS not found"
-        assert ".input-group" in html_content, "Input group CSS not found"
+    @pytest.mark.parametrize(
+        "fixture_name, needle, message",
+        CONTENT_CHECKS,
+        ids=[f"{fixture}:{needle}" for fixture, needle, _ in CONTENT_CHECKS],
+    )
+    def test_file_contains(self, request, fixture_name, needle, message):
+        """Test that a web interface file contains a required substring."""
+        assert needle in request.getfixturevalue(fixture_name), message
 
-    def test_web_explorer_html_javascript_functions(self):
+    def test_web_explorer_html_javascript_functions(self, html_content):
         """Test that web_explorer.html contains required JavaScript functions."""
-        # Use relative path that works in both local and CI environments
-        html_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "web_explorer.html"
-        )
-
-        with open(html_path, "r") as f:
-            html_content = f.read()
-
         # Check for JavaScript functions in the new interface
-        required_functions = [
-            "runDemo",
-            "runCustomQuery",
-            "switchTab",
-            "updateCustomForm",
-            "checkConnection",
+        missing = [
+            n
+            for n in REQUIRED_JS_FUNCTIONS
+            if f"function {n}" not in html_content and f"{n}(" not in html_content
         ]
-
-        for func_name in required_functions:
-            assert (
-                f"function {func_name}" in html_content
-                or f"{func_name}(" in html_content
-            ), f"JavaScript function '{func_name}' not found"
+        assert not missing, f"JavaScript functions not found: {missing}"
 
         # Check for demo configurations
-        assert (
-            "attack_path:" in html_content
-        ), "Attack path demo configuration not found"
-        assert (
-            "coverage_gaps:" in html_content
-        ), "Coverage gaps demo configuration not found"
-        assert (
-            "technique_relationships:" in html_content
-        ), "Technique relationships demo configuration not found"
+        missing = [i for i in DEMO_CONFIG_INDICATORS if i not in html_content]
+        assert not missing, f"Demo configurations not found: {missing}"
 
-    def test_web_explorer_html_form_configurations(self):
+    def test_web_explorer_html_form_configurations(self, html_content):
         """Test that web_explorer.html contains proper form configurations for each tool."""
-        # Use relative path that works in both local and CI environments
-        html_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "web_explorer.html"
-        )
-
-        with open(html_path, "r") as f:
-            html_content = f.read()
-
-        # Check for form elements in the custom query tab
-        assert "start_tactic" in html_content, "start_tactic input not found"
-        assert "end_tactic" in html_content, "end_tactic input not found"
-        assert "threat_groups" in html_content, "threat_groups input not found"
-        assert "technique_id_rel" in html_content, "technique_id_rel input not found"
-
-        # Check for tool selection dropdown
-        assert "toolSelect" in html_content, "Tool selection dropdown not found"
-        assert "build_attack_path" in html_content, "build_attack_path option not found"
-        assert (
-            "analyze_coverage_gaps" in html_content
-        ), "analyze_coverage_gaps option not found"
-        assert (
-            "detect_technique_relationships" in html_content
-        ), "detect_technique_relationships option not found"
-
-    def test_http_proxy_contains_advanced_tools(self):
-        """Test that http_proxy.py contains advanced tool definitions."""
-        # Use relative path that works in both local and CI environments
-        proxy_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "http_proxy.py"
-        )
+        # Form inputs for the custom query tab plus the tool selection dropdown
+        missing = [i for i in FORM_INDICATORS if i not in html_content]
+        assert not missing, f"Form configuration elements not found: {missing}"
 
-        with open(proxy_path, "r") as f:
-            proxy_content = f.read()
-
-        # Check for advanced tools in the HTTP proxy
-        assert (
-            "build_attack_path" in proxy_content
-        ), "build_attack_path not found in HTTP proxy"
-        assert (
-            "analyze_coverage_gaps" in proxy_content
-        ), "analyze_coverage_gaps not found in HTTP proxy"
-        assert (
-            "detect_technique_relationships" in proxy_content
-        ), "detect_technique_relationships not found in HTTP proxy"
-
-        # Check for tool descriptions
-        assert (
-            "multi-stage attack paths" in proxy_content
-        ), "Attack path description not found"
-        assert "coverage gaps" in proxy_content, "Coverage gaps description not found"
-        assert (
-            "STIX relationships" in proxy_content
-        ), "STIX relationships description not found"
-
-    def test_http_proxy_tool_schemas(self):
+    def test_http_proxy_tool_schemas(self, proxy_content):
         """Test that http_proxy.py contains proper schemas for advanced tools."""
-        # Use relative path that works in both local and CI environments
-        proxy_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "http_proxy.py"
-        )
-
-        with open(proxy_path, "r") as f:
-            proxy_content = f.read()
-
-        # Check for required parameters in tool schemas
-        assert "start_tactic" in proxy_content, "start_tactic parameter not found"
-        assert "end_tactic" in proxy_content, "end_tactic parameter not found"
-        assert "threat_groups" in proxy_content, "threat_groups parameter not found"
-        assert "technique_id" in proxy_content, "technique_id parameter not found"
-
-        # Check for parameter types
-        assert '"type": "array"' in proxy_content, "Array parameter type not found"
-        assert (
-            '"items": {"type": "string"}' in proxy_content
-        ), "Array items type not found"
+        # Required parameters and parameter types in the tool schemas
+        missing = [i for i in SCHEMA_INDICATORS if i not in proxy_content]
+        assert not missing, f"Tool schema elements not found: {missing}"
 
-    def test_start_explorer_script_compatibility(self):
-        """Test that start_explorer.py is compatible with the new interface."""
-        # Use relative path that works in both local and CI environments
-        script_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "start_explorer.py"
-        )
-
-        with open(script_path, "r") as f:
-            script_content = f.read()
-
-        # Check for async compatibility
-        assert (
-            "async def" in script_content
-        ), "Async functions not found in start_explorer.py"
-        assert (
-            "create_http_proxy_server" in script_content
-        ), "create_http_proxy_server import not found"
-        assert "aiohttp" in script_content, "aiohttp dependency check not found"
-
-    def test_web_interface_tool_count_consistency(self):
+    def test_web_interface_tool_count_consistency(self, html_content, proxy_content):
         """Test that web interface shows consistent tool count."""
-        # Use relative path that works in both local and CI environments
-        html_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "web_explorer.html"
-        )
-        proxy_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "http_proxy.py"
-        )
-
-        with open(html_path, "r") as f:
-            html_content = f.read()
-
-        with open(proxy_path, "r") as f:
-            proxy_content = f.read()
-
         # Check that web interface mentions 8 tools
         assert (
             "8 Tools Available" in html_content
@@ -223,29 +175,3 @@ class TestWebInterfaceAdvanced:
         assert (
             tool_count >= 8
         ), f"Expected at least 8 tools in HTTP proxy, found {tool_count}"
-
-    def test_web_interface_styling_consistency(self):
-        """Test that web interface has consistent modern styling."""
-        # Use relative path that works in both local and CI environments
-        html_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "web_explorer.html"
-        )
-
-        with open(html_path, "r") as f:
-            html_content = f.read()
-
-        # Check for modern CSS features
-        assert "var(--" in html_content, "CSS custom properties not found"
-        assert "linear-gradient" in html_content, "Gradient styling not found"
-        assert "border-radius" in html_content, "Modern border radius not found"
-        assert "box-shadow" in html_content, "Modern shadows not found"
-
-        # Check for responsive design
-        assert "@media" in html_content, "Responsive media queries not found"
-        assert "grid-template-columns" in html_content, "CSS Grid not found"
-        assert "flex" in html_content, "Flexbox not found"
-
-        # Check for modern interaction features
-        assert "transition:" in html_content, "CSS transitions not found"
-        assert "transform:" in html_content, "CSS transforms not found"
-        assert ":hover" in html_content, "Hover effects not found"